@@ -11,13 +11,13 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-"""Read in a .xls file and generate a units module for OpenHTF.
+"""Read in a .xls or .xlsx file and generate a units module for OpenHTF.
 
 UNECE, the United Nations Economic Commission for Europe, publishes a set of
 unit codes for international trade in the form of Excel spreadsheets (.xls
-files). Various revisions of the spreadsheet can be found as part of the the
-downloadable "Codes for Units of Measurement used in the International Trade"
-.zip archive listed here:
+files, or .xlsx for recent revisions). Various revisions of the spreadsheet can
+be found as part of the the downloadable "Codes for Units of Measurement used in
+the International Trade" .zip archive listed here:
 
 http://www.unece.org/cefact/codesfortrade/codes_index.html
 
@@ -38,13 +38,11 @@ spaces into underscores, and converting to uppercase.
 """
 
 import argparse
+import contextlib
+import multiprocessing
 import os
 import re
-import shutil
 import sys
-import tempfile
-
-import xlrd
 
 # Column names for the columns we care about. This list must be populated in
 # the expected order: [<name label>, <code label>, <suffix label>].
@@ -102,14 +100,11 @@ class UnitDescriptor(
   pass
 
 
-ALL_UNITS = []
-
 # pylint: disable=line-too-long
 
 # NO_DIMENSION means that there are units set, but they cannot be expressed
 # by a known dimension (such as a ratio)
 NO_DIMENSION = UnitDescriptor('No dimension', 'NDL', None)
-ALL_UNITS.append(NO_DIMENSION)
 NONE = UnitDescriptor('None', None, None)
 '''
 
@@ -120,29 +115,53 @@ SECOND = SECOND_UNIT_OF_TIME
 
 # pylint: enable=line-too-long
 
+_LOOKUP_NAMES = ('UNITS_BY_NAME', 'UNITS_BY_SUFFIX', 'UNITS_BY_ALL')
+
+
+def _build_lookups():
+  """Builds the UNITS_BY_* dicts, which are deferred until first needed."""
+  # pylint: disable=global-statement,global-variable-undefined
+  global UNITS_BY_NAME, UNITS_BY_SUFFIX, UNITS_BY_ALL
+  UNITS_BY_NAME = {u.name: u for u in ALL_UNITS}
+  UNITS_BY_SUFFIX = {u.suffix: u for u in ALL_UNITS}
+
+  UNITS_BY_ALL = {}
+  UNITS_BY_ALL.update(UNITS_BY_NAME)
+  UNITS_BY_ALL.update(UNITS_BY_SUFFIX)
+  UNITS_BY_ALL[None] = NONE
+  return UNITS_BY_ALL
+
+
+def __dir__():
+  """Lists the UNITS_BY_* dicts even before they have been built."""
+  return sorted(set(globals()) | set(_LOOKUP_NAMES))
+
+
+def __getattr__(name):
+  """Builds the UNITS_BY_* dicts on first access."""
+  if name in _LOOKUP_NAMES:
+    _build_lookups()
+    return globals()[name]
+  if name == '__all__':
+    # Lets `from units import *` include the UNITS_BY_* dicts as well.
+    return [n for n in __dir__() if not n.startswith('_')]
+  raise AttributeError('module %r has no attribute %r' % (__name__, name))
+
 
 class UnitLookup(object):
   """Facilitates user-friendly access to units."""
 
-  def __init__(self, lookup):
+  def __init__(self, lookup=None):
     self._lookup = lookup
 
   def __call__(self, name_or_suffix):
     """Provides instantiation-like access for units module."""
+    if self._lookup is None:
+      self._lookup = globals().get('UNITS_BY_ALL') or _build_lookups()
     return self._lookup[name_or_suffix]
 
 
-UNITS_BY_NAME = {u.name: u for u in ALL_UNITS}
-UNITS_BY_SUFFIX = {u.suffix: u for u in ALL_UNITS}
-
-del ALL_UNITS
-
-UNITS_BY_ALL = {}
-UNITS_BY_ALL.update(UNITS_BY_NAME)
-UNITS_BY_ALL.update(UNITS_BY_SUFFIX)
-UNITS_BY_ALL[None] = NONE
-
-Unit = UnitLookup(UNITS_BY_ALL)  # pylint: disable=invalid-name
+Unit = UnitLookup()  # pylint: disable=invalid-name
 '''
 
 SHEET_NAME = 'Annex II & Annex III'
@@ -162,11 +181,27 @@ UNIT_KEY_REPLACEMENTS = {
     '15': 'FIFTEEN',
     '30': 'THIRTY',
     '\\': '_',
-    chr(160): '_',  # NO-BREAK SPACE
-    chr(176): 'DEG_',  # DEGREE SIGN
-    chr(186): 'DEG_',  # MASCULINE ORDINAL INDICATOR
-    chr(8211): '_',  # EN DASH
+    '\xa0': '_',  # NO-BREAK SPACE
+    '\xb0': 'DEG_',  # DEGREE SIGN
+    '\xba': 'DEG_',  # MASCULINE ORDINAL INDICATOR
+    '\u2013': '_',  # EN DASH
+}
+# Keys that map to '' are removed in a first str.translate() pass, so that
+# digits brought together by a removal (e.g. '1(5)') still match '15' below.
+# All other replacements are then made in a single scan with one alternation;
+# longer keys come first so that e.g. '15' wins over any shorter key it
+# contains. Names are uppercased before any replacement, so keys must be
+# unaffected by upper() and values must already be uppercase.
+UNIT_KEY_REMOVALS = {
+    ord(old): None for old, new in UNIT_KEY_REPLACEMENTS.items() if not new
 }
+UNIT_KEY_RE = re.compile('|'.join(
+    re.escape(old)
+    for old in sorted(UNIT_KEY_REPLACEMENTS, key=len, reverse=True)
+    if UNIT_KEY_REPLACEMENTS[old]))
+UNDERSCORES_RE = re.compile(r'_+')
+# Number of rows handed to a worker process at a time with --processes.
+NORMALIZE_CHUNKSIZE = 1000
 
 
 def main():
@@ -175,7 +210,8 @@ def main():
       description='Reads in a .xls file and generates a units module for '
       'OpenHTF.',
       prog='python units_from_xls.py')
-  parser.add_argument('xlsfile', type=str, help='the .xls file to parse')
+  parser.add_argument(
+      'xlsfile', type=str, help='the .xls or .xlsx file to parse')
   parser.add_argument(
       '--outfile',
       type=str,
@@ -183,77 +219,192 @@ def main():
           os.path.dirname(__file__), os.path.pardir, 'openhtf', 'util',
           'units.py'),
       help='where to put the generated .py file.')
+  parser.add_argument(
+      '--processes',
+      type=int,
+      default=1,
+      help='number of worker processes used to normalize rows; only worth '
+      'raising for very large sheets.')
   args = parser.parse_args()
 
   if not os.path.exists(args.xlsfile):
-    print('Unable to locate the file "%s".' % args.xlsfile)
-    parser.print_help()
-    sys.exit()
+    parser.error('Unable to locate the file "%s".' % args.xlsfile)
 
-  unit_defs = unit_defs_from_sheet(
-      xlrd.open_workbook(args.xlsfile).sheet_by_name(SHEET_NAME), COLUMN_NAMES)
+  # Write next to the destination so the final rename never crosses a
+  # filesystem boundary and cannot degrade into a copy.
+  tmp_path = args.outfile + '.tmp'
+  try:
+    with (multiprocessing.Pool(args.processes)
+          if args.processes > 1 else contextlib.nullcontext()) as pool:
+      unit_defs = unit_defs_from_sheet(
+          _open_sheet(args.xlsfile, SHEET_NAME), COLUMN_NAMES, pool=pool)
 
-  _, tmp_path = tempfile.mkstemp()
-  with open(tmp_path, 'w') as new_file:
-    new_file.write(PRE)
-    new_file.writelines([line.encode('utf8', 'replace') for line in unit_defs])
-    new_file.write(POST)
-    new_file.flush()
+      with open(tmp_path, 'w', encoding='utf8', errors='replace') as new_file:
+        new_file.write(''.join([PRE, *unit_defs, POST]))
+    os.replace(tmp_path, args.outfile)
+  finally:
+    # Only left behind if generation failed part way through.
+    if os.path.exists(tmp_path):
+      os.remove(tmp_path)
 
-  os.remove(args.outfile)
-  shutil.move(tmp_path, args.outfile)
 
+def _open_sheet(path, sheet_name):
+  """A generator over the cell values of one worksheet, header row first.
 
-def unit_defs_from_sheet(sheet, column_names):
+  .xlsx files are streamed with openpyxl in read-only mode; anything else is
+  handed to xlrd, loading only the requested sheet.
+
+  Args:
+    path: Path to the .xls or .xlsx file.
+    sheet_name: Name of the worksheet to read.
+
+  Yields:
+    A sequence of cell values for each row in the worksheet.
+  """
+  if os.path.splitext(path)[1].lower() == '.xlsx':
+    import openpyxl  # pylint: disable=g-import-not-at-top
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+      for row in workbook[sheet_name].iter_rows(values_only=True):
+        # Empty cells come back as None, where xlrd would give ''.
+        yield tuple('' if value is None else value for value in row)
+    except KeyError:
+      sys.exit('Unable to process the .xlsx file.')
+    finally:
+      workbook.close()
+    return
+
+  import xlrd  # pylint: disable=g-import-not-at-top
+  try:
+    # Only the units sheet is needed; on_demand keeps xlrd from parsing the
+    # other annexes in the workbook.
+    workbook = xlrd.open_workbook(
+        path, on_demand=True, formatting_info=False)
+  except xlrd.XLRDError:
+    sys.exit('Unable to process the .xls file.')
+  try:
+    sheet = workbook.sheet_by_name(sheet_name)
+    for row_idx in range(sheet.nrows):
+      yield sheet.row_values(row_idx)
+  except xlrd.XLRDError:
+    sys.exit('Unable to process the .xls file.')
+  finally:
+    workbook.release_resources()
+
+
+def unit_defs_from_sheet(rows, column_names, pool=None):
   """A generator that parses a worksheet containing UNECE code definitions.
 
   Args:
-    sheet: An xldr.sheet object representing a UNECE code worksheet.
+    rows: An iterator over the cell values of each row of a UNECE code
+      worksheet, starting with the header row (see _open_sheet).
     column_names: A list/tuple with the expected column names corresponding to
       the unit name, code and suffix in that order.
+    pool: Optional multiprocessing.Pool used to normalize rows in parallel.
+      Output order does not depend on whether a pool is used.
 
   Yields:
-    Lines of Python source code that define OpenHTF Unit objects.
+    Lines of Python source code that define OpenHTF Unit objects, followed by
+    a single ALL_UNITS list literal containing every unit.
+
+  Raises:
+    ValueError: The worksheet has no header row or defines no units.
   """
+  all_units = ['NO_DIMENSION']  # Defined in PRE.
   seen = set()
-  try:
-    col_indices = {}
-    rows = sheet.get_rows()
-
-    # Find the indices for the columns we care about.
-    for idx, cell in enumerate(next(rows)):
-      if cell.value in column_names:
-        col_indices[cell.value] = idx
-
-    # loop over all remaining rows and pull out units.
-    for row in rows:
-      name = row[col_indices[column_names[0]]].value.replace("'", r'\'')
-      code = row[col_indices[column_names[1]]].value
-      suffix = row[col_indices[column_names[2]]].value.replace("'", r'\'')
-      key = unit_key_from_name(name)
-      if key in seen:
-        continue
-      seen.add(key)
-
-      # Split on ' or ' to support the units like '% or pct'
-      for suffix in suffix.split(' or '):
-        yield "%s = UnitDescriptor('%s', '%s', '''%s''')\n" % (key, name, code,
-                                                               suffix)
-        yield 'ALL_UNITS.append(%s)\n' % key
+  col_indices = {}
+  header = next(rows, None)
+  if header is None:
+    raise ValueError('The worksheet has no header row.')
+
+  # Find the indices for the columns we care about.
+  for idx, value in enumerate(header):
+    if value in column_names:
+      col_indices[value] = idx
+  name_idx, code_idx, suffix_idx = (
+      col_indices[column_name] for column_name in column_names)
+
+  unique_rows = _unique_rows(rows, name_idx, code_idx, suffix_idx)
+  if pool is None:
+    normalized_rows = map(_normalize_row, unique_rows)
+  else:
+    normalized_rows = pool.imap(_normalize_row, unique_rows,
+                                NORMALIZE_CHUNKSIZE)
+
+  # loop over all remaining rows and pull out units.
+  for key, name, code, suffix in normalized_rows:
+    if key in seen:
+      continue
+    seen.add(key)
+
+    # Split on ' or ' to support the units like '% or pct'. Only the last of
+    # these is bound to the key, so the others are listed in ALL_UNITS inline.
+    suffixes = suffix.split(' or ')
+    for suffix in suffixes[:-1]:
+      all_units.append("UnitDescriptor('%s', '%s', '''%s''')" %
+                       (name, code, suffix))
+    all_units.append(key)
+    yield "%s = UnitDescriptor('%s', '%s', '''%s''')\n" % (key, name, code,
+                                                           suffixes[-1])
+
+  if not seen:
+    raise ValueError('The worksheet defines no units.')
+  yield '\nALL_UNITS = [\n%s]\n' % ''.join(
+      '    %s,\n' % unit for unit in all_units)
+
+
+def _unique_rows(rows, name_idx, code_idx, suffix_idx):
+  """A generator that drops rows whose unit name was already seen.
 
-  except xlrd.XLRDError:
-    sys.stdout.write('Unable to process the .xls file.')
+  Args:
+    rows: An iterator over the cell values of each worksheet row.
+    name_idx: Column index of the unit name.
+    code_idx: Column index of the unit code.
+    suffix_idx: Column index of the unit suffix.
+
+  Yields:
+    A (name, code, suffix) tuple for each row with a name not seen yet.
+  """
+  seen_names = set()
+  for row in rows:
+    name = row[name_idx]
+    # An exact repeat of a name always maps to a key we've already seen, so
+    # skip it before doing any escaping or normalization.
+    if name in seen_names:
+      continue
+    seen_names.add(name)
+    yield name, row[code_idx], row[suffix_idx]
+
+
+def _normalize_row(row):
+  """Escapes a (name, code, suffix) row and computes its unit key.
+
+  This is a module-level function so that it can be sent to worker processes.
+
+  Args:
+    row: A (name, code, suffix) tuple of cell values.
+
+  Returns:
+    A (key, name, code, suffix) tuple, with apostrophes in name and suffix
+    escaped for use in the generated source.
+  """
+  name, code, suffix = row
+  # Most cells have no apostrophe; skip the copy replace() would make.
+  if "'" in name:
+    name = name.replace("'", r'\'')
+  if "'" in suffix:
+    suffix = suffix.replace("'", r'\'')
+  return unit_key_from_name(name), name, code, suffix
 
 
 def unit_key_from_name(name):
   """Return a legal python name for the given name for use as a unit key."""
-  result = name
-
-  for old, new in UNIT_KEY_REPLACEMENTS.items():
-    result = result.replace(old, new)
+  result = UNIT_KEY_RE.sub(
+      lambda match: UNIT_KEY_REPLACEMENTS[match.group(0)],
+      name.upper().translate(UNIT_KEY_REMOVALS))
 
-  # Collapse redundant underscores and convert to uppercase.
-  result = re.sub(r'_+', '_', result.upper())
+  # Collapse redundant underscores, including those introduced above.
+  result = UNDERSCORES_RE.sub('_', result)
 
   return result
 
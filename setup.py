@@ -214,7 +214,7 @@ setup(
             'libusb1>=1.3.0',
             'M2Crypto>=0.22.3',
         ],
-        'update_units': ['xlrd>=1.0.0',],
+        'update_units': ['xlrd>=1.0.0', 'openpyxl>=2.6.0',],
         'serial_collection_plug': ['pyserial>=3.3.0',],
         'examples': ['pandas>=0.22.0',],
     },
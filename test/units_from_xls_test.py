@@ -0,0 +1,304 @@
+# Copyright 2021 Google Inc. All Rights Reserved.
+
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+
+#     http://www.apache.org/licenses/LICENSE-2.0
+
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Unit tests for the bin/units_from_xls.py units module generator."""
+
+import importlib.util
+import io
+import multiprocessing
+import os
+import sys
+import tempfile
+import types
+import unittest
+from unittest import mock
+
+try:
+  import openpyxl  # pylint: disable=g-import-not-at-top
+except ImportError:
+  openpyxl = None
+
+_SCRIPT_PATH = os.path.join(
+    os.path.dirname(__file__), os.path.pardir, 'bin', 'units_from_xls.py')
+
+
+def _load_script():
+  spec = importlib.util.spec_from_file_location('units_from_xls', _SCRIPT_PATH)
+  module = importlib.util.module_from_spec(spec)
+  # Registered so that worker processes can unpickle _normalize_row.
+  sys.modules[spec.name] = module
+  spec.loader.exec_module(module)
+  return module
+
+
+units_from_xls = _load_script()
+
+_ROWS = [
+    ('Status', 'Common\nCode', 'Name', 'Symbol'),
+    ('', 'MIN', 'minute [unit of time]', 'min'),
+    ('', 'SEC', 'second [unit of time]', 's'),
+    ('', 'P1', 'percent', '% or pct'),
+    ('', 'ZZI', "inch's", "in'"),
+    ('', 'MTS', 'metre per second', 'm/s'),
+    # Exact duplicate name, and a different name with the same key.
+    ('', 'XXX', 'metre per second', 'x'),
+    ('', 'YYY', 'metre-per second', 'y'),
+]
+
+
+def _generate_module(rows, pool=None):
+  """Generates a units module from rows and returns it imported."""
+  body = ''.join(
+      units_from_xls.unit_defs_from_sheet(
+          iter(rows), units_from_xls.COLUMN_NAMES, pool=pool))
+  module = types.ModuleType('generated_units')
+  source = units_from_xls.PRE + body + units_from_xls.POST
+  exec(source, module.__dict__)  # pylint: disable=exec-used
+  return module
+
+
+class _FakeXLRDError(Exception):
+  pass
+
+
+def _fake_xlrd(rows):
+  """Returns a stand-in for the xlrd module serving rows from one sheet."""
+  sheet = mock.Mock(nrows=len(rows))
+  sheet.row_values.side_effect = lambda row_idx: list(rows[row_idx])
+  workbook = mock.Mock()
+  workbook.sheet_by_name.return_value = sheet
+  return mock.Mock(
+      XLRDError=_FakeXLRDError,
+      open_workbook=mock.Mock(return_value=workbook))
+
+
+class UnitKeyFromNameTest(unittest.TestCase):
+
+  def test_replacements(self):
+    self.assertEqual('METRE_PER_SECOND',
+                     units_from_xls.unit_key_from_name('metre per second'))
+    self.assertEqual('DEG_C_PERCENT',
+                     units_from_xls.unit_key_from_name('\xb0C %'))
+    self.assertEqual('EIGHT_FIFTEEN_THIRTY',
+                     units_from_xls.unit_key_from_name('8 15 30'))
+    self.assertEqual('_A_B_', units_from_xls.unit_key_from_name('__a - b_'))
+
+  def test_digits_joined_by_removed_characters(self):
+    self.assertEqual('FIFTEEN_X', units_from_xls.unit_key_from_name('1(5) x'))
+    self.assertEqual('FIFTEEN', units_from_xls.unit_key_from_name('1[5]'))
+    self.assertEqual('THIRTY_Y', units_from_xls.unit_key_from_name("3'0 y"))
+
+
+class UnitDefsFromSheetTest(unittest.TestCase):
+
+  def assert_generated_module(self, units):
+    unit_desc = units.UnitDescriptor
+    percent = unit_desc('percent', 'P1', '%')
+    percent_pct = unit_desc('percent', 'P1', 'pct')
+    metre_per_second = unit_desc('metre per second', 'MTS', 'm/s')
+    self.assertEqual([
+        units.NO_DIMENSION,
+        unit_desc('minute [unit of time]', 'MIN', 'min'),
+        unit_desc('second [unit of time]', 'SEC', 's'),
+        percent,
+        percent_pct,
+        unit_desc("inch's", 'ZZI', "in'"),
+        metre_per_second,
+    ], units.ALL_UNITS)
+
+    self.assertEqual(percent_pct, units.PERCENT)
+    self.assertEqual(metre_per_second, units.METRE_PER_SECOND)
+    self.assertEqual(units.MINUTE_UNIT_OF_TIME, units.MINUTE)
+    self.assertEqual(percent, units.Unit('%'))
+    self.assertEqual(percent_pct, units.Unit('pct'))
+    self.assertEqual(metre_per_second, units.Unit('metre per second'))
+    self.assertEqual(units.NONE, units.Unit(None))
+
+    self.assertEqual(percent, units.UNITS_BY_ALL['%'])
+    self.assertEqual(percent_pct, units.UNITS_BY_ALL['percent'])
+    self.assertNotIn('x', units.UNITS_BY_ALL)
+    self.assertNotIn('y', units.UNITS_BY_ALL)
+
+  def test_generated_module(self):
+    self.assert_generated_module(_generate_module(_ROWS))
+
+  @unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(),
+                       'requires the fork start method')
+  def test_generated_module_with_pool(self):
+    with multiprocessing.get_context('fork').Pool(2) as pool:
+      units = _generate_module(_ROWS, pool=pool)
+    self.assert_generated_module(units)
+
+  def test_empty_sheet_raises(self):
+    with self.assertRaisesRegex(ValueError, 'no header row'):
+      list(units_from_xls.unit_defs_from_sheet(
+          iter([]), units_from_xls.COLUMN_NAMES))
+    with self.assertRaisesRegex(ValueError, 'no units'):
+      list(units_from_xls.unit_defs_from_sheet(
+          iter(_ROWS[:1]), units_from_xls.COLUMN_NAMES))
+
+
+class LazyLookupsTest(unittest.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    self.units = _generate_module(_ROWS)
+
+  def test_unit_call_builds_lookups(self):
+    self.assertNotIn('UNITS_BY_ALL', vars(self.units))
+    self.assertEqual(self.units.PERCENT, self.units.Unit('pct'))
+    self.assertIn('UNITS_BY_ALL', vars(self.units))
+    self.assertIs(self.units.UNITS_BY_ALL, self.units.Unit._lookup)
+
+  def test_attribute_access_builds_lookups(self):
+    self.assertEqual(self.units.PERCENT,
+                     self.units.UNITS_BY_NAME['percent'])
+    self.assertEqual(self.units.NONE, self.units.UNITS_BY_ALL[None])
+    with self.assertRaises(AttributeError):
+      _ = self.units.UNITS_BY_CODE
+
+  def test_dir_and_star_import_include_lookups(self):
+    self.assertIn('UNITS_BY_SUFFIX', dir(self.units))
+    self.assertNotIn('UNITS_BY_SUFFIX', vars(self.units))
+    namespace = {}
+    star_import = 'from generated_units import *'
+    with mock.patch.dict(sys.modules, generated_units=self.units):
+      exec(star_import, namespace)  # pylint: disable=exec-used
+    self.assertEqual(self.units.PERCENT, namespace['UNITS_BY_SUFFIX']['pct'])
+    self.assertNotIn('_build_lookups', namespace)
+
+  def test_unit_lookup_accepts_explicit_lookup(self):
+    lookup = self.units.UnitLookup({'pct': self.units.PERCENT})
+    self.assertEqual(self.units.PERCENT, lookup('pct'))
+    self.assertNotIn('UNITS_BY_ALL', vars(self.units))
+
+
+class OpenSheetTest(unittest.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    tmp_dir = tempfile.TemporaryDirectory()
+    self.addCleanup(tmp_dir.cleanup)
+    self.tmp_dir = tmp_dir.name
+
+  def write_xlsx(self, rows):
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = 'Sheet'
+    for row in rows:
+      sheet.append(row)
+    path = os.path.join(self.tmp_dir, 'rec20.xlsx')
+    workbook.save(path)
+    return path
+
+  @unittest.skipUnless(openpyxl, 'requires openpyxl')
+  def test_xlsx_maps_empty_cells_to_empty_strings(self):
+    path = self.write_xlsx([('Name', 'Common\nCode', 'Symbol'),
+                            ('lift', None, 'lft')])
+    self.assertEqual([('Name', 'Common\nCode', 'Symbol'), ('lift', '', 'lft')],
+                     list(units_from_xls._open_sheet(path, 'Sheet')))
+
+  @unittest.skipUnless(openpyxl, 'requires openpyxl')
+  def test_xlsx_missing_sheet_exits(self):
+    path = self.write_xlsx([('Name', 'Common\nCode', 'Symbol')])
+    with self.assertRaises(SystemExit) as exit_context:
+      list(units_from_xls._open_sheet(path, 'Missing'))
+    self.assertEqual('Unable to process the .xlsx file.',
+                     exit_context.exception.code)
+
+  def test_xls_yields_row_values(self):
+    with mock.patch.dict(sys.modules, xlrd=_fake_xlrd(_ROWS)):
+      rows = list(units_from_xls._open_sheet('rec20.xls', 'Sheet'))
+    self.assertEqual([list(row) for row in _ROWS], rows)
+
+  def test_xls_missing_sheet_exits(self):
+    xlrd = _fake_xlrd(_ROWS)
+    workbook = xlrd.open_workbook.return_value
+    workbook.sheet_by_name.side_effect = _FakeXLRDError
+    with mock.patch.dict(sys.modules, xlrd=xlrd), \
+        self.assertRaises(SystemExit) as exit_context:
+      list(units_from_xls._open_sheet('rec20.xls', 'Missing'))
+    self.assertEqual('Unable to process the .xls file.',
+                     exit_context.exception.code)
+    workbook.release_resources.assert_called_once_with()
+
+  def test_xls_loads_on_demand_and_releases_workbook(self):
+    xlrd = _fake_xlrd(_ROWS)
+    with mock.patch.dict(sys.modules, xlrd=xlrd):
+      rows = units_from_xls._open_sheet('rec20.xls', 'Sheet')
+      next(rows)
+      rows.close()
+    xlrd.open_workbook.assert_called_once_with(
+        'rec20.xls', on_demand=True, formatting_info=False)
+    workbook = xlrd.open_workbook.return_value
+    workbook.sheet_by_name.assert_called_once_with('Sheet')
+    workbook.release_resources.assert_called_once_with()
+
+
+class MainTest(unittest.TestCase):
+
+  def setUp(self):
+    super().setUp()
+    tmp_dir = tempfile.TemporaryDirectory()
+    self.addCleanup(tmp_dir.cleanup)
+    self.xlsfile = os.path.join(tmp_dir.name, 'rec20.xls')
+    self.outfile = os.path.join(tmp_dir.name, 'units.py')
+    for path in (self.xlsfile, self.outfile):
+      with open(path, 'w') as f:
+        f.write('original')
+
+  def run_main(self, rows, *args):
+    argv = ['units_from_xls.py', self.xlsfile, '--outfile', self.outfile]
+    with mock.patch.object(sys, 'argv', argv + list(args)), \
+        mock.patch.object(units_from_xls, '_open_sheet',
+                          return_value=iter(rows)):
+      units_from_xls.main()
+
+  def test_replaces_outfile(self):
+    self.run_main(_ROWS)
+    with open(self.outfile, encoding='utf8') as f:
+      contents = f.read()
+    self.assertTrue(contents.startswith(units_from_xls.PRE))
+    self.assertIn("PERCENT = UnitDescriptor('percent', 'P1', '''pct''')",
+                  contents)
+    self.assertFalse(os.path.exists(self.outfile + '.tmp'))
+
+  def test_failure_keeps_outfile_and_removes_tmp(self):
+    with self.assertRaises(KeyError):
+      self.run_main([('Wrong', 'Header')] + _ROWS[1:])
+    with open(self.outfile) as f:
+      self.assertEqual('original', f.read())
+    self.assertFalse(os.path.exists(self.outfile + '.tmp'))
+
+
+  @unittest.skipUnless(
+      (multiprocessing.get_start_method(allow_none=True) or
+       multiprocessing.get_all_start_methods()[0]) == 'fork',
+      'worker processes must inherit the test-loaded script module')
+  def test_processes(self):
+    self.run_main(_ROWS, '--processes', '2')
+    with open(self.outfile, encoding='utf8') as f:
+      self.assertIn("PERCENT = UnitDescriptor('percent', 'P1', '''pct''')",
+                    f.read())
+
+  def test_missing_input_exits_with_usage_error(self):
+    os.remove(self.xlsfile)
+    stderr = io.StringIO()
+    with mock.patch.object(sys, 'stderr', stderr), \
+        self.assertRaises(SystemExit) as exit_context:
+      self.run_main(_ROWS)
+    self.assertEqual(2, exit_context.exception.code)
+    self.assertIn('Unable to locate the file', stderr.getvalue())
+
+if __name__ == '__main__':
+  unittest.main()